@@ -21,26 +21,58 @@ Notes:
 
 from __future__ import annotations
 
+import bisect
+import concurrent.futures
 import datetime as _dt
+import functools
+import gzip
 import hashlib
+import http.client
 import http.server
+import itertools
 import json
-import socketserver
+import sys
 import textwrap
+import threading
+import time
 import urllib.request
 import urllib.error
-from urllib.parse import urlparse
+
+try:  # optional: faster JSON serialization
+    import orjson
+except ImportError:  # stdlib-only mode
+    orjson = None
+
+try:  # optional: keep-alive connection pooling for the history feed
+    import urllib3
+except ImportError:  # stdlib-only mode
+    urllib3 = None
+
+try:  # optional: brotli-compressed HTML for clients that accept it
+    import brotli
+except ImportError:  # stdlib-only mode
+    brotli = None
+
+try:  # optional: event-loop server instead of the thread pool
+    from aiohttp import web
+    HAVE_AIOHTTP = True
+except ImportError:  # stdlib-only mode
+    web = None
+    HAVE_AIOHTTP = False
 
 
 HOST = "127.0.0.1"
 PORT = 8000
+MAX_WORKERS = 32
+REQUEST_TIMEOUT_S = 5
+REFRESH_INTERVAL_S = 3600
 
 
 # -----------------------------
 # Content (safe + cozy + smart)
 # -----------------------------
 
-NEW_MOM_TIPS = [
+NEW_MOM_TIPS = (
     "If you did one small kind thing for yourself today (water, snack, shower, a 2-minute stretch), that counts as winning.",
     "Sleep isn’t a moral issue. Any rest you get is valid. If you can, trade naps like a pager rotation: one on, one off.",
     "If you feel overwhelmed, shrink the scope: ‘next 10 minutes’ instead of ‘the whole day.’",
@@ -49,9 +81,9 @@ NEW_MOM_TIPS = [
     "If visitors add work, you’re allowed to say: ‘We’d love help—could you bring food or fold laundry?’",
     "Gentle reminder: you don’t need to ‘bounce back.’ You’re not an app rollback. You’re a human.",
     "Try the ‘minimum viable routine’: one anchor you can usually do (tea, sunlight, a short walk, a playlist).",
-]
+)
 
-DEVOPS_FACTS = [
+DEVOPS_FACTS = (
     "Blameless postmortems work because they optimize for learning, not punishment—systems fail; humans adapt.",
     "Idempotency is self-care for infrastructure: running it twice shouldn’t make things worse.",
     "Good alerts are actionable. If it can’t be acted on, it’s probably noise (and noise steals rest).",
@@ -59,19 +91,19 @@ DEVOPS_FACTS = [
     "The fastest incident response is often: reduce scope, restore service, then investigate. Same with hard nights.",
     "Backpressure is a kindness: it protects downstream systems—like saying ‘not today’ to extra commitments.",
     "‘You build it, you run it’ is powerful—until burnout. Sustainable on-call is a feature, not a luxury.",
-]
+)
 
 # Cozy “Totoro-style” prompts: vibe-forward, not claiming any official association.
-COZY_ANIME_VIBES = [
+COZY_ANIME_VIBES = (
     "Forest spirit moment: notice one tiny detail (steam from tea, warm socks, the sound of rain).",
     "Soft animation rule: slow down one scene today. You don’t have to time-lapse your life.",
     "Kindness quest: send one simple message to someone you trust: ‘Could use a little encouragement today.’",
     "Tiny heroism: do one small helpful task that future-you will thank you for (refill water, prep a snack).",
     "Gentle magic: open a window for 60 seconds. Fresh air counts as a reset.",
     "Cozy soundtrack: play one calming song and breathe with it—no productivity required.",
-]
+)
 
-POWER_COUPLE_CHALLENGES = [
+POWER_COUPLE_CHALLENGES = (
     {
         "title": "The 7-Minute Hand-Off",
         "why": "Reduce friction + keep teamwork alive.",
@@ -99,67 +131,147 @@ POWER_COUPLE_CHALLENGES = [
             "After: 30-second retro—one thing that worked.",
         ],
     },
-]
+)
 
-CAT_CORNER = [
+CAT_CORNER = (
     "Cat pro-tip: put a soft blanket in a ‘cat-approved’ spot near where you feed/rock baby—cats love being included without being on top of you.",
     "If the litter box smell suddenly changes, it might be time for a deeper clean—or a quick vet check if behavior changes. (Trust your instincts.)",
     "A scratching post near the high-traffic baby zone can redirect stress scratching into something positive.",
     "Keep dangling strings/ribbons out of reach—cats + tired humans + small objects is a chaos combo.",
-]
+)
 
-LOCAL_FUN_FACTS = [
+LOCAL_FUN_FACTS = (
     "Honey never spoils—archaeologists have tasted ancient honey found in tombs.",
     "Octopuses have three hearts and blue blood.",
     "Bananas are berries, but strawberries aren’t (botany is a menace).",
     "The dot over an ‘i’ or ‘j’ is called a ‘tittle.’",
     "Cats have fewer taste receptors for sweetness than humans do.",
     "The first computer ‘bug’ was famously a moth found in a relay.",
-]
+)
 
-KIND_REMINDERS = [
+KIND_REMINDERS = (
     "You are not behind. You are living through a high-demand season.",
     "Your worth is not measured in output, cleanliness, or inbox zero.",
     "Asking for help is senior-level engineering: it’s resource management.",
     "You can be brilliant and exhausted at the same time.",
-]
+)
+
+# Content is never mutated at runtime; bind the lengths once.
+_N_NEW_MOM_TIPS = len(NEW_MOM_TIPS)
+_N_DEVOPS_FACTS = len(DEVOPS_FACTS)
+_N_COZY_ANIME_VIBES = len(COZY_ANIME_VIBES)
+_N_POWER_COUPLE_CHALLENGES = len(POWER_COUPLE_CHALLENGES)
+_N_CAT_CORNER = len(CAT_CORNER)
+_N_LOCAL_FUN_FACTS = len(LOCAL_FUN_FACTS)
+_N_KIND_REMINDERS = len(KIND_REMINDERS)
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
 
-def _seed_for_date(d: _dt.date) -> int:
-    h = hashlib.sha256(d.isoformat().encode("utf-8")).hexdigest()
-    return int(h[:8], 16)
-
-def pick_daily(items: list[str], d: _dt.date) -> str:
-    if not items:
+def _mix(ordinal: int) -> int:
+    # Knuth multiplicative hash: deterministic, cheap, and spreads well
+    # enough over the small list lengths used here. It is a single integer
+    # op, so there is nothing for a JIT to win back.
+    return (ordinal * 2654435761) & 0xFFFFFFFF
+
+@functools.lru_cache(maxsize=1024)
+def _pick_idx(length: int, ordinal: int) -> int:
+    # The index only depends on the list length and the date.
+    return _mix(ordinal) % length
+
+def pick_daily(items: tuple[str, ...], d: _dt.date, n: int | None = None) -> str:
+    # `n` may be passed as a precomputed len(items).
+    if n is None:
+        n = len(items)
+    if not n:
         return ""
-    idx = _seed_for_date(d) % len(items)
-    return items[idx]
+    return items[_pick_idx(n, d.toordinal())]
 
-def pick_daily_obj(items: list[dict], d: _dt.date) -> dict:
-    if not items:
+def pick_daily_obj(items: tuple[dict, ...], d: _dt.date, n: int | None = None) -> dict:
+    if n is None:
+        n = len(items)
+    if not n:
         return {}
-    idx = _seed_for_date(d) % len(items)
-    return items[idx]
+    return items[_pick_idx(n, d.toordinal())]
 
-def try_fetch_wikimedia_onthisday(d: _dt.date, timeout_s: float = 2.0) -> dict | None:
+# Hosts serving the same "On this day" feed, as (host, path template).
+_MIRRORS = {
+    "api.wikimedia.org": "/feed/v1/wikipedia/en/onthisday/all/{mm}/{dd}",
+    "en.wikipedia.org": "/api/rest_v1/feed/onthisday/all/{mm}/{dd}",
+}
+# Bounded load: never try more than this many hosts per refresh.
+_MAX_MIRROR_TRIES = 2
+
+
+def _ring_hash(key: str) -> int:
+    return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class Ring:
     """
-    Wikimedia 'On this day' feed:
-      https://api.wikimedia.org/feed/v1/wikipedia/en/onthisday/all/MM/DD
-    Returns parsed JSON dict or None on failure.
+    Tiny consistent-hash ring. `get(key)` returns every node, ordered by
+    preference for that key, so callers can walk the ring on failure.
     """
-    mm = str(d.month)
-    dd = str(d.day)
-    url = f"https://api.wikimedia.org/feed/v1/wikipedia/en/onthisday/all/{mm}/{dd}"
+
+    def __init__(self, nodes, replicas: int = 32):
+        points = sorted(
+            (_ring_hash(f"{node}#{i}"), node) for node in nodes for i in range(replicas)
+        )
+        self._hashes = [h for h, _ in points]
+        self._nodes = [n for _, n in points]
+        self._count = len(set(nodes))
+
+    def get(self, key: str) -> list[str]:
+        if not self._nodes:
+            return []
+        out: list[str] = []
+        start = bisect.bisect(self._hashes, _ring_hash(key))
+        for i in range(len(self._nodes)):
+            node = self._nodes[(start + i) % len(self._nodes)]
+            if node not in out:
+                out.append(node)
+                if len(out) == self._count:
+                    break
+        return out
+
+
+_MIRROR_RING = Ring(_MIRRORS)
+
+
+# A UA helps some endpoints behave nicely.
+_USER_AGENT = "CozySmartMamaHub/1.0 (single-file python demo)"
+
+# One shared pool, so daily refreshes reuse the established TLS connection.
+_HTTP = (
+    urllib3.PoolManager(
+        maxsize=2,
+        # No retries (the ring handles failover), but follow redirects like
+        # urlopen does.
+        retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=2),
+        headers={"User-Agent": _USER_AGENT},
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+def _fetch_json(url: str, timeout_s: float) -> dict | None:
+    if _HTTP is not None:
+        try:
+            resp = _HTTP.request(
+                "GET", url, timeout=urllib3.Timeout(connect=min(1.0, timeout_s), read=timeout_s)
+            )
+            if resp.status != 200:
+                return None
+            return json.loads(resp.data)
+        except (urllib3.exceptions.HTTPError, ValueError):
+            return None
+
     req = urllib.request.Request(
         url,
-        headers={
-            # A UA helps some endpoints behave nicely.
-            "User-Agent": "CozySmartMamaHub/1.0 (single-file python demo)"
-        },
+        headers={"User-Agent": _USER_AGENT},
         method="GET",
     )
     try:
@@ -168,9 +280,28 @@ def try_fetch_wikimedia_onthisday(d: _dt.date, timeout_s: float = 2.0) -> dict |
                 return None
             data = resp.read()
         return json.loads(data.decode("utf-8"))
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, json.JSONDecodeError):
+    # urlopen lets some socket/http.client errors through unwrapped
+    # (RemoteDisconnected, IncompleteRead, resets during read()).
+    except (OSError, http.client.HTTPException, ValueError):
         return None
 
+def try_fetch_wikimedia_onthisday(d: _dt.date, timeout_s: float = 2.0) -> dict | None:
+    """
+    Wikimedia 'On this day' feed:
+      https://api.wikimedia.org/feed/v1/wikipedia/en/onthisday/all/MM/DD
+    The same (month, day) always prefers the same mirror, so upstream caches
+    stay warm; on failure the next host on the ring is tried.
+    Returns parsed JSON dict or None on failure.
+    """
+    mm = str(d.month)
+    dd = str(d.day)
+    for host in _MIRROR_RING.get(f"{mm}/{dd}")[:_MAX_MIRROR_TRIES]:
+        url = f"https://{host}" + _MIRRORS[host].format(mm=mm, dd=dd)
+        payload = _fetch_json(url, timeout_s)
+        if payload is not None:
+            return payload
+    return None
+
 def summarize_onthisday(payload: dict) -> list[dict]:
     """
     Turn Wikimedia payload into a small list of safe, readable bullets.
@@ -184,15 +315,13 @@ def summarize_onthisday(payload: dict) -> list[dict]:
     births = payload.get("births") or []
 
     def pick_top(items, n=3):
-        cleaned = []
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            year = it.get("year")
-            text = it.get("text") or ""
-            if text:
-                cleaned.append({"year": year, "text": text})
-        return cleaned[:n]
+        # Stop as soon as n usable items are found; payloads can be long.
+        cleaned = (
+            {"year": it.get("year"), "text": it["text"]}
+            for it in items
+            if isinstance(it, dict) and it.get("text")
+        )
+        return list(itertools.islice(cleaned, n))
 
     for e in pick_top(events, 3):
         out.append({"kind": "event", **e})
@@ -202,26 +331,35 @@ def summarize_onthisday(payload: dict) -> list[dict]:
     return out
 
 
+# Static strings shared by every day's payload.
+_DISCLAIMER = sys.intern(
+    "This page is for comfort + education only, not medical advice. If you’re worried about your health or safety, contact a clinician or local emergency number."
+)
+_SRC_WIKIMEDIA = sys.intern("wikimedia")
+_SRC_LOCAL = sys.intern("local")
+
+# Summarized Wikimedia items per date, filled by _refresher().
+_ONTHISDAY_CACHE: dict[_dt.date, list[dict]] = {}
+_ONTHISDAY_LOCK = threading.Lock()
+
+
 def build_day_data(today: _dt.date) -> dict:
-    tip = pick_daily(NEW_MOM_TIPS, today)
-    devops = pick_daily(DEVOPS_FACTS, today)
-    vibe = pick_daily(COZY_ANIME_VIBES, today)
-    cat = pick_daily(CAT_CORNER, today)
-    reminder = pick_daily(KIND_REMINDERS, today)
-    challenge = pick_daily_obj(POWER_COUPLE_CHALLENGES, today)
-    fun_fact = pick_daily(LOCAL_FUN_FACTS, today)
-
-    onthisday = []
-    src = "local"
-    wiki_payload = try_fetch_wikimedia_onthisday(today)
-    if wiki_payload:
-        onthisday = summarize_onthisday(wiki_payload)
-        if onthisday:
-            src = "wikimedia"
+    tip = pick_daily(NEW_MOM_TIPS, today, _N_NEW_MOM_TIPS)
+    devops = pick_daily(DEVOPS_FACTS, today, _N_DEVOPS_FACTS)
+    vibe = pick_daily(COZY_ANIME_VIBES, today, _N_COZY_ANIME_VIBES)
+    cat = pick_daily(CAT_CORNER, today, _N_CAT_CORNER)
+    reminder = pick_daily(KIND_REMINDERS, today, _N_KIND_REMINDERS)
+    challenge = pick_daily_obj(POWER_COUPLE_CHALLENGES, today, _N_POWER_COUPLE_CHALLENGES)
+    fun_fact = pick_daily(LOCAL_FUN_FACTS, today, _N_LOCAL_FUN_FACTS)
+
+    # Never fetch on the request path; the background refresher fills this in.
+    with _ONTHISDAY_LOCK:
+        onthisday = _ONTHISDAY_CACHE.get(today, [])
+    src = _SRC_WIKIMEDIA if onthisday else _SRC_LOCAL
 
     return {
         "date": today.isoformat(),
-        "safe_disclaimer": "This page is for comfort + education only, not medical advice. If you’re worried about your health or safety, contact a clinician or local emergency number.",
+        "safe_disclaimer": _DISCLAIMER,
         "new_mom_tip": tip,
         "devops_fact": devops,
         "anime_vibe": vibe,
@@ -234,6 +372,85 @@ def build_day_data(today: _dt.date) -> dict:
     }
 
 
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+# The day data only changes at local midnight, so keep one serialized copy
+# (date, body, etag, has_history).
+_DAY_CACHE: tuple[_dt.date, bytes, str, bool] | None = None
+_DAY_LOCK = threading.Lock()
+DAY_MAX_AGE_S = 600
+
+def _day_cache_control(today: _dt.date, has_history: bool) -> str:
+    # The local fallback is replaced as soon as the refresher lands, so make
+    # clients revalidate (cheap via ETag). Otherwise never cache past midnight.
+    if not has_history:
+        return "no-cache"
+    midnight = _dt.datetime.combine(today + _dt.timedelta(days=1), _dt.time())
+    left = int((midnight - _dt.datetime.now()).total_seconds())
+    return f"public, max-age={max(0, min(DAY_MAX_AGE_S, left))}"
+
+def day_data_bytes(today: _dt.date) -> tuple[bytes, str, str]:
+    """
+    Return (json_body, etag, cache_control) for `today`, building the body
+    at most once per date.
+    """
+    global _DAY_CACHE
+    with _DAY_LOCK:
+        if _DAY_CACHE is None or _DAY_CACHE[0] != today:
+            data = build_day_data(today)
+            body = _dumps(data)
+            has_history = data["on_this_day_source"] == _SRC_WIKIMEDIA
+            _DAY_CACHE = (today, body, _etag(body), has_history)
+        _, body, etag, has_history = _DAY_CACHE
+    return body, etag, _day_cache_control(today, has_history)
+
+
+def refresh_onthisday(today: _dt.date) -> bool:
+    """
+    Fetch + summarize the Wikimedia feed for `today` into the cache.
+    Returns True if usable items were stored.
+    """
+    global _DAY_CACHE
+    payload = try_fetch_wikimedia_onthisday(today)
+    items = summarize_onthisday(payload) if payload else []
+    if not items:
+        return False
+    with _ONTHISDAY_LOCK:
+        _ONTHISDAY_CACHE.clear()
+        _ONTHISDAY_CACHE[today] = items
+    # A local-fallback copy may already be cached for today; drop it.
+    with _DAY_LOCK:
+        if _DAY_CACHE is not None and _DAY_CACHE[0] == today:
+            _DAY_CACHE = None
+    return True
+
+
+def _refresher():
+    # Wake at least hourly (and right after local midnight) and fetch the
+    # feed once per day; failed fetches are retried on the next wake-up.
+    while True:
+        today = _dt.date.today()
+        with _ONTHISDAY_LOCK:
+            have_today = today in _ONTHISDAY_CACHE
+        if not have_today:
+            try:
+                refresh_onthisday(today)
+            except Exception as exc:
+                # This is the only refresher; never let one failure stop it.
+                print(f"On this day refresh failed: {exc!r}", file=sys.stderr)
+        now = _dt.datetime.now()
+        midnight = _dt.datetime.combine(now.date() + _dt.timedelta(days=1), _dt.time())
+        time.sleep(min(REFRESH_INTERVAL_S, (midnight - now).total_seconds() + 1))
+
+
 def html_page() -> str:
     # Keep the HTML fully static; JS calls /api/daydata for dynamic content.
     # Everything is “safe” and avoids medical claims.
@@ -743,48 +960,276 @@ def html_page() -> str:
 """
 
 
+# The page is fully static, so build + encode it once at import time.
+_HTML_BYTES = html_page().encode("utf-8")
+# Pre-compressed variants: a one-time cost at startup, zero per request.
+_HTML_GZIP = gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0)
+_HTML_BR = brotli.compress(_HTML_BYTES, quality=11) if brotli is not None else None
+_HTML_CACHE_CONTROL = "public, max-age=60"
+
+
+def _frame_head(
+    status: int,
+    headers: dict[str, str],
+    body_length: int | None = None,
+    protocol: str = http.server.BaseHTTPRequestHandler.protocol_version,
+) -> bytes:
+    """
+    Status line + headers (+ Content-Length last, if given), without the
+    blank line. Handler._write_frame adds Date/Server and the body, so a
+    response goes out as a single write. The handler speaks HTTP/1.0 and
+    closes the connection after each response.
+    """
+    reason = http.server.BaseHTTPRequestHandler.responses.get(status, ("",))[0]
+    head = f"{protocol} {status} {reason}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    if body_length is not None:
+        head += f"Content-Length: {body_length}\r\n"
+    return head.encode("latin-1")
+
+
+def _html_variant(
+    body: bytes, encoding: str | None
+) -> tuple[bytes, str, dict[str, str], bytes]:
+    # Each encoding is its own representation, so each gets its own ETag.
+    etag = _etag(body)
+    headers = {
+        "Content-Type": "text/html; charset=utf-8",
+        "Cache-Control": _HTML_CACHE_CONTROL,
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return body, etag, headers, _frame_head(200, headers, len(body))
+
+
+# encoding -> (body, etag, headers minus Content-Length, pre-built 200 head)
+_HTML_VARIANTS = {
+    None: _html_variant(_HTML_BYTES, None),
+    "gzip": _html_variant(_HTML_GZIP, "gzip"),
+}
+if _HTML_BR is not None:
+    _HTML_VARIANTS["br"] = _html_variant(_HTML_BR, "br")
+_HEALTH_BYTES = b"ok\n"
+_NOTFOUND_BYTES = b"Not found\n"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    True if an If-None-Match header value already covers `etag`.
+    """
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _html_encoding_for(accept_encoding: str) -> str | None:
+    """
+    Pick the best pre-compressed HTML variant for an Accept-Encoding value.
+    """
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    if "br" in _HTML_VARIANTS and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
 # -----------------------------
 # HTTP server
 # -----------------------------
 
 class Handler(http.server.BaseHTTPRequestHandler):
-    def _send(self, status: int, body: bytes, content_type: str = "text/plain; charset=utf-8"):
-        self.send_response(status)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(body)))
-        self.send_header("Cache-Control", "no-store")
-        self.end_headers()
-        self.wfile.write(body)
+    # Drop idle connections (e.g. speculative browser sockets) so they
+    # can't hold a pool worker forever.
+    timeout = REQUEST_TIMEOUT_S
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str = "text/plain; charset=utf-8",
+        extra_headers: dict[str, str] | None = None,
+        cache_control: str = "no-store",
+    ):
+        headers = {"Content-Type": content_type, "Cache-Control": cache_control}
+        headers.update(extra_headers or {})
+        head = _frame_head(status, headers, len(body), self.protocol_version)
+        self._write_frame(status, head, body)
+
+    def _write_frame(self, status: int, head: bytes, body: bytes = b""):
+        """
+        Finish a _frame_head() frame with Date/Server and write it at once,
+        skipping send_response's per-header formatting.
+        """
+        self.log_request(status)
+        resp = bytearray(head)
+        resp += (
+            f"Date: {self.date_time_string()}\r\n"
+            f"Server: {self.version_string()}\r\n\r\n"
+        ).encode("latin-1")
+        resp += body
+        self.wfile.write(resp)
+
+    def _send_cached(
+        self,
+        body: bytes,
+        content_type: str,
+        etag: str,
+        cache_control: str,
+        extra_headers: dict[str, str] | None = None,
+    ):
+        headers = {"ETag": etag, **(extra_headers or {})}
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            return self._send_304(cache_control, headers)
+        return self._send(200, body, content_type, headers, cache_control)
+
+    def _send_304(self, cache_control: str, headers: dict[str, str]):
+        headers = {"Cache-Control": cache_control, **headers}
+        self._write_frame(304, _frame_head(304, headers, protocol=self.protocol_version))
+
+    def _serve_index(self):
+        encoding = _html_encoding_for(self.headers.get("Accept-Encoding", ""))
+        body, etag, _, head = _HTML_VARIANTS[encoding]
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+            return self._send_304(_HTML_CACHE_CONTROL, headers)
+        # Hot path: pre-built head + body, one write.
+        self._write_frame(200, head, body)
+
+    def _serve_daydata(self):
+        body, etag, cache_control = day_data_bytes(_dt.date.today())
+        return self._send_cached(
+            body, "application/json; charset=utf-8", etag, cache_control
+        )
+
+    # simple health
+    def _serve_health(self):
+        return self._send(200, _HEALTH_BYTES, "text/plain; charset=utf-8")
+
+    # All routes are exact paths, so routing is a single dict lookup.
+    _ROUTES = {
+        "/": _serve_index,
+        "/index.html": _serve_index,
+        "/api/daydata": _serve_daydata,
+        "/health": _serve_health,
+    }
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
+        # Query strings are ignored; partition is far cheaper than urlparse.
+        handler = self._ROUTES.get(self.path.partition("?")[0])
+        if handler is not None:
+            return handler(self)
+        return self._send(404, _NOTFOUND_BYTES, "text/plain; charset=utf-8")
 
-        if path == "/" or path == "/index.html":
-            page = html_page().encode("utf-8")
-            return self._send(200, page, "text/html; charset=utf-8")
+    def log_message(self, fmt, *args):
+        # Quiet logs (comment out to enable request logging)
+        return
 
-        if path == "/api/daydata":
-            today = _dt.date.today()
-            data = build_day_data(today)
-            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
-            return self._send(200, body, "application/json; charset=utf-8")
 
-        # simple health
-        if path == "/health":
-            return self._send(200, b"ok\n", "text/plain; charset=utf-8")
+class PooledHTTPServer(http.server.HTTPServer):
+    """
+    HTTPServer that hands requests to a bounded thread pool instead of
+    spawning a new thread per connection.
+    """
+    allow_reuse_address = True
 
-        return self._send(404, b"Not found\n", "text/plain; charset=utf-8")
+    def __init__(self, *args, max_workers: int = MAX_WORKERS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
-    def log_message(self, fmt, *args):
-        # Quiet logs (comment out to enable request logging)
-        return
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Queued connections are dropped; running ones end within
+        # Handler.timeout, so interpreter exit doesn't hang on the pool.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# -----------------------------
+# Optional aiohttp server
+# -----------------------------
+# Same routes and caching rules as Handler, on one event loop. Every handler
+# only reads precomputed bytes, so none of them block the loop.
+
+async def _aio_index(request):
+    encoding = _html_encoding_for(request.headers.get("Accept-Encoding", ""))
+    body, etag, headers, _ = _HTML_VARIANTS[encoding]
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return web.Response(
+            status=304,
+            headers={"Cache-Control": _HTML_CACHE_CONTROL, "ETag": etag, "Vary": "Accept-Encoding"},
+        )
+    return web.Response(body=body, headers=headers)
+
+async def _aio_daydata(request):
+    body, etag, cache_control = day_data_bytes(_dt.date.today())
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return web.Response(
+            status=304, headers={"Cache-Control": cache_control, "ETag": etag}
+        )
+    return web.Response(
+        body=body,
+        headers={
+            "Content-Type": "application/json; charset=utf-8",
+            "Cache-Control": cache_control,
+            "ETag": etag,
+        },
+    )
+
+async def _aio_health(request):
+    return web.Response(
+        body=_HEALTH_BYTES,
+        headers={"Content-Type": "text/plain; charset=utf-8", "Cache-Control": "no-store"},
+    )
+
+async def _aio_notfound(request):
+    return web.Response(
+        status=404,
+        body=_NOTFOUND_BYTES,
+        headers={"Content-Type": "text/plain; charset=utf-8", "Cache-Control": "no-store"},
+    )
+
+def make_aiohttp_app():
+    app = web.Application()
+    app.router.add_get("/", _aio_index)
+    app.router.add_get("/index.html", _aio_index)
+    app.router.add_get("/api/daydata", _aio_daydata)
+    app.router.add_get("/health", _aio_health)
+    app.router.add_get("/{tail:.*}", _aio_notfound)
+    return app
 
 
 def main():
-    with socketserver.TCPServer((HOST, PORT), Handler) as httpd:
-        print(f"Cozy Smart Mama Hub running at http://{HOST}:{PORT}")
-        print("Press Ctrl+C to stop.")
+    threading.Thread(target=_refresher, name="onthisday-refresher", daemon=True).start()
+    print(f"Cozy Smart Mama Hub running at http://{HOST}:{PORT}")
+    print("Press Ctrl+C to stop.")
+    if HAVE_AIOHTTP:
+        web.run_app(make_aiohttp_app(), host=HOST, port=PORT, print=None)
+        return
+    with PooledHTTPServer((HOST, PORT), Handler) as httpd:
         httpd.serve_forever()
 
 